@@ -54,11 +54,6 @@ class O3_ARM_PostK_Int_B(FUDesc):
                OpDesc(opClass='IprAccess', opLat=3, pipelined=True)]
     count = 1
 
-class O3_ARM_PostK_Int_C(FUDesc):
-    opList = [ OpDesc(opClass='IntAlu', opLat=1),
-               OpDesc(opClass='IprAccess', opLat=3, pipelined=True) ]
-    count = 1
-
 # Floating point and SIMD instructions
 class O3_ARM_PostK_FLA(FUDesc):
     opList = [ OpDesc(opClass='SimdAdd', opLat=4),
@@ -158,23 +153,26 @@ class O3_ARM_PostK_LoadStore(FUDesc):
                OpDesc(opClass='FloatMemWrite',opLat=1),
                #OpDesc(opClass='SveMemWrite', opLat=1)
     ]
-    count = 1
+    count = 2
 
 # Functional Units for this CPU
 class O3_ARM_PostK_FUP(FUPool):
     FUList = [O3_ARM_PostK_Int_A(), O3_ARM_PostK_Int_B(),
               O3_ARM_PostK_FLA(), O3_ARM_PostK_FLB(),
-              O3_ARM_PostK_LoadStore(), O3_ARM_PostK_LoadStore()]
+              O3_ARM_PostK_LoadStore()]
+
+class O3_ARM_PostK_BTB(SimpleBTB):
+    numEntries = 4096
+    tagBits = 18
 
 # Bi-Mode Branch Predictor
 class O3_ARM_PostK_BP(BiModeBP):
+    btb = O3_ARM_PostK_BTB()
+    ras = ReturnAddrStack(numEntries=8)
     globalPredictorSize = 16384
     globalCtrBits = 2
     choicePredictorSize = 16384
     choiceCtrBits = 2
-    BTBEntries = 4096
-    BTBTagSize = 18
-    RASSize = 8
     instShiftAmt = 2
 
 class O3_ARM_PostK_3(DerivO3CPU):
@@ -214,7 +212,7 @@ class O3_ARM_PostK_3(DerivO3CPU):
     backComSize = 25 # 5
     forwardComSize = 20 # 4
     numPhysIntRegs = 96
-    numPhysFloatRegs = 512
+    numPhysFloatRegs = 160 # 512
     numPhysVecRegs = 128
     #numPhysPredRegs = 48
     numIQEntries = 48 # 64
@@ -251,13 +249,16 @@ class O3_ARM_PostK_DCache(Cache):
     assoc = 4
     write_buffers = 21
     writeback_clean = False
-    prefetch_on_access = True
     #downgrade_on_shared_req = False
     #forward_clean_evict = False
     #one_port = True
     #evict_latency = 3
     #writeback_latency = 4
-    prefetcher = StridePrefetcher(degree=8, latency = 1)
+    # Train on every access. prefetch_on_pf_hit would otherwise
+    # short-circuit the check on hits.
+    prefetcher = StridePrefetcher(degree=8, latency = 1,
+                                  prefetch_on_access = True,
+                                  prefetch_on_pf_hit = False)
     #prefetcher = KPrefetcher(l1degree=2, latency=1, queue_size=80,
     #                         l1maxprfofs=1536, on_inst=False,
     #                         l2maxprfofs=10240, writeprefetch=True)
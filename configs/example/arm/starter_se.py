@@ -76,18 +76,29 @@ cpu_types = {
             devices.L1I, devices.L1D, devices.L2),
     "o3" : (O3CPU,
             devices.L1I, devices.L1D, devices.L2),
-    "timing" : (ObjectList.cpu_list.get("O3_ARM_v7a_3"),
+    "timing" : (O3_ARM_v7a_3,
             devices.L1I, devices.L1D, devices.L2),
-    "ex5" : (ObjectList.cpu_list.get("ex5_big"),
+    "ex5" : (ex5_big.ex5_big,
             ex5_big.L1I, ex5_big.L1D, ex5_big.L2),
-    "ex5l" : (ObjectList.cpu_list.get("ex5_LITTLE"),
+    "ex5l" : (ex5_LITTLE.ex5_LITTLE,
             ex5_LITTLE.L1I, ex5_LITTLE.L1D, ex5_LITTLE.L2),
-    "pk" : (ObjectList.cpu_list.get("O3_ARM_PostK_3"),
+    "pk" : (PostK.O3_ARM_PostK_3,
             PostK.O3_ARM_PostK_ICache, PostK.O3_ARM_PostK_DCache,
             PostK.O3_ARM_PostK_L2)
 }
 
 
+# Simulation exit causes that mark the end of the fast-forward phase.
+ff_exit_causes = (
+    "workbegin",
+    "a thread reached the max instruction count",
+)
+
+
+def fast_forwarding(args):
+    return args.fast_forward > 0 or args.roi_switch
+
+
 class SimpleSeSystem(System):
     '''
     Example system class for syscall emulation mode
@@ -117,35 +128,63 @@ class SimpleSeSystem(System):
         self.system_port = self.membus.cpu_side_ports
 
 
+        # Set the instruction limit on the CPU class so that every CPU
+        # instance inherits it.
+        if args.maxinsts:
+            cpu_types[args.cpu][0].max_insts_all_threads = args.maxinsts
+
+        # When fast-forwarding, the cluster starts out with atomic CPUs
+        # that own the cache hierarchy of the requested CPU type. The
+        # detailed CPUs are created switched out and take over once the
+        # fast-forward phase is done.
+        cpu_config = cpu_types[args.cpu]
+        if fast_forwarding(args):
+            cpu_config = (AtomicSimpleCPU,) + tuple(cpu_config[1:])
+
         # Add CPUs to the system. A cluster of CPUs typically have
         # private L1 caches and a shared L2 cache.
         self.cpu_cluster = devices.CpuCluster(self,
                                               args.num_cores,
                                               args.cpu_freq, "1.2V",
-                                              *cpu_types[args.cpu])
+                                              *cpu_config)
+
+        self._detailed_cpus = self.cpu_cluster.cpus
+        if fast_forwarding(args):
+            cpu_class = cpu_types[args.cpu][0]
+            clk_domain = self.cpu_cluster.clk_domain
+            self.switch_cpus = [ cpu_class(switched_out=True, cpu_id=idx,
+                                           clk_domain=clk_domain)
+                                 for idx in range(args.num_cores) ]
+            for cpu, switch_cpu in zip(self.cpu_cluster.cpus,
+                                       self.switch_cpus):
+                switch_cpu.isa = cpu.isa
+                switch_cpu.createThreads()
+                if args.fast_forward:
+                    cpu.max_insts_any_thread = args.fast_forward
+            self._detailed_cpus = self.switch_cpus
+
+        # Exit the simulation loop on m5_work_begin/m5_work_end so that
+        # the script can switch CPUs or checkpoint at the region of
+        # interest.
+        if args.roi_switch or args.take_checkpoint_at_roi:
+            self.exit_on_work_items = True
 
         # Create a cache hierarchy (unless we are simulating a
         # functional CPU in atomic memory mode) for the CPU cluster
         # and connect it to the shared memory bus.
-        if self.cpu_cluster.memoryMode() == "timing":
+        if cpu_types[args.cpu][0].memory_mode() == "timing":
             self.cpu_cluster.addL1()
             self.cpu_cluster.addL2(self.cpu_cluster.clk_domain)
         elif args.cpu == "ac":
             self.cpu_cluster.addL1()
             self.cpu_cluster.addL2(self.cpu_cluster.clk_domain)
-            for i in range(args.num_cores):
-                self.cpu_cluster.cpus[i].branchPred = O3_ARM_v7a_BP()
+            for cpu in self._detailed_cpus:
+                cpu.branchPred = O3_ARM_v7a_BP()
         self.cpu_cluster.connectMemSide(self.membus)
 
-        if args.maxinsts:
-            for i in range(args.num_cores):
-                self.cpu_cluster.cpus[i].max_insts_all_threads = \
-                    args.maxinsts
-
         if args.simpoint_profile:
-            for i in range(args.num_cores):
-                self.cpu_cluster.cpus[i].addSimPointProbe(
-                    args.simpoint_interval)
+            for cpu in self.cpu_cluster.cpus:
+                cpu.addSimPointProbe(args.simpoint_interval)
 
         # Tell gem5 about the memory mode used by the CPUs we are
         # simulating.
@@ -163,16 +202,23 @@ class SimpleSeSystem(System):
     def numCpus(self):
         return self._num_cpus
 
+    def detailedCpus(self):
+        return self._detailed_cpus
+
+    def switchCpuList(self):
+        return list(zip(self.cpu_cluster.cpus, self.switch_cpus))
+
 def get_processes(cmd):
     """Interprets commands to run and returns a list of processes"""
 
     cwd = os.getcwd()
+    gid = os.getgid()
     multiprocesses = []
     for idx, c in enumerate(cmd):
         argv = shlex.split(c)
 
         process = Process(pid=100 + idx, cwd=cwd, cmd=argv, executable=argv[0])
-        process.gid = os.getgid()
+        process.gid = gid
 
         print("info: %d. command and arguments: %s" % (idx + 1, process.cmd))
         multiprocesses.append(process)
@@ -194,14 +240,44 @@ def create(args):
                                    cpu_types[args.cpu][2], None)
         else:
             devices.L2.size = args.l2_size
+    # Sectored tags keep one tag and one replacement entry per sector
+    # instead of per block, which shrinks the L2 tag store.
+    l2_type = cpu_types[args.cpu][3]
+    if args.l2_blocks_per_sector > 1 and l2_type is not None:
+        l2_type.tags = SectorTags(
+            num_blocks_per_sector=args.l2_blocks_per_sector)
     if args.random > 0:
         args, branchPred = generate_configs(args, args.random - 1)
+    if args.bp_scale != 1:
+        bp = PostK.O3_ARM_PostK_BP
+        scale = args.bp_scale
+        bp.globalPredictorSize = int(int(bp.globalPredictorSize) * scale)
+        bp.choicePredictorSize = int(int(bp.choicePredictorSize) * scale)
+        btb = PostK.O3_ARM_PostK_BTB
+        btb.numEntries = int(int(btb.numEntries) * scale)
 
     system = SimpleSeSystem(args)
 
     if args.random > 0:
-        for i in range(args.num_cores):
-            system.cpu_cluster.cpus[i].branchPred = branchPred()
+        for cpu in system.detailedCpus():
+            cpu.branchPred = branchPred()
+
+    # Prefetcher state is not saved in checkpoints, so don't spend host
+    # time training the L1D prefetcher on the way to the ROI checkpoint.
+    if args.take_checkpoint_at_roi:
+        for cpu in system.cpu_cluster.cpus:
+            dcache = getattr(cpu, "dcache", None)
+            if dcache is not None:
+                dcache.prefetcher = NULL
+
+    # Only notify the L1D prefetchers on misses and on hits to
+    # prefetched lines. This changes the prefetch stream and results.
+    if args.l1d_prefetch_on_miss:
+        for cpu in system.cpu_cluster.cpus:
+            dcache = getattr(cpu, "dcache", None)
+            if dcache is not None and dcache.prefetcher != NULL:
+                dcache.prefetcher.prefetch_on_access = False
+                dcache.prefetcher.prefetch_on_pf_hit = True
 
     # Tell components about the expected physical memory ranges. This
     # is, for example, used by the MemConfig helper to determine where
@@ -229,6 +305,9 @@ def create(args):
     # Assign one workload to each CPU
     for cpu, workload in zip(system.cpu_cluster.cpus, processes):
         cpu.workload = workload
+    if fast_forwarding(args):
+        for cpu, workload in zip(system.switch_cpus, processes):
+            cpu.workload = workload
 
     return system
 
@@ -257,6 +336,14 @@ def main():
     parser.add_argument("--l1d_size", type=str, default="")
     parser.add_argument("--l1i_size", type=str, default="")
     parser.add_argument("--l2_size", type=str, default="")
+    parser.add_argument("--l1d-prefetch-on-miss", action="store_true",
+                        help="Train the L1D prefetcher on misses and "
+                        "prefetched-line hits only, instead of on every "
+                        "access (changes simulated results)")
+    parser.add_argument("--l2-blocks-per-sector", type=int, default=1,
+                        choices=[1, 2, 4, 8],
+                        help="Use sectored L2 tags with this many blocks "
+                        "per sector")
     parser.add_argument("--maxinsts", type=int, default=0, help="Total " \
                         "number of instructions to simulate")
     parser.add_argument("--simpoint-profile", action="store_true",
@@ -265,12 +352,35 @@ def main():
                         help="SimPoint interval in num of instructions")
     parser.add_argument("--checkpoint-at-end", action="store_true",
                         help="take a checkpoint at end of run")
-    parser.add_argument("--restore", type=str, default=None)
+    parser.add_argument("--restore", type=str, default=None,
+                        help="Restore from a checkpoint directory, e.g. one "
+                        "taken with --take-checkpoint-at-roi. Combine with "
+                        "--fast-forward to warm up the caches before "
+                        "switching to the --cpu model")
+    parser.add_argument("--take-checkpoint-at-roi", action="store_true",
+                        help="Take a checkpoint (cpt.roi) when the workload "
+                        "calls m5_work_begin and exit. Combine with "
+                        "--roi-switch to reach the ROI on atomic CPUs")
     parser.add_argument("--random", "-r", type=int, default=0,
                         help="Random number for configurations")
+    parser.add_argument("--bp-scale", type=float, default=1,
+                        choices=[1, 0.5, 0.25, 0.125],
+                        help="Scale the O3_ARM_PostK branch predictor and "
+                        "BTB tables, e.g. for quick exploration sweeps")
+    parser.add_argument("--fast-forward", type=int, default=0,
+                        help="Number of instructions to fast-forward on an "
+                        "atomic CPU before switching to the --cpu model")
+    parser.add_argument("--roi-switch", action="store_true",
+                        help="Fast-forward on an atomic CPU until the "
+                        "workload calls m5_work_begin, then switch to the "
+                        "--cpu model until m5_work_end")
 
     args = parser.parse_args()
 
+    if args.take_checkpoint_at_roi and args.fast_forward > 0:
+        parser.error("--take-checkpoint-at-roi cannot be combined with "
+                     "--fast-forward")
+
     # Create a single root node for gem5's object hierarchy. There can
     # only exist one root node in the simulator at any given
     # time. Tell gem5 that we want to use syscall emulation mode
@@ -288,6 +398,26 @@ def main():
     else:
         m5.instantiate()
 
+    # Simulate up to the start of the region of interest and save a
+    # checkpoint there, so that later runs can skip process startup.
+    if args.take_checkpoint_at_roi:
+        event = m5.simulate()
+        if event.getCause() == "workbegin":
+            m5.checkpoint(os.path.join(m5.options.outdir, "cpt.roi"))
+        print(f"{event.getCause()} ({event.getCode()}) @ {m5.curTick()}")
+        return
+
+    # Run the fast-forward phase on the atomic CPUs and hand over to
+    # the detailed CPUs once it is done. Statistics are reset so that
+    # they only cover the detailed part of the run.
+    if fast_forwarding(args):
+        event = m5.simulate()
+        if event.getCause() not in ff_exit_causes:
+            print(f"{event.getCause()} ({event.getCode()}) @ {m5.curTick()}")
+            return
+        m5.switchCpus(root.system, root.system.switchCpuList())
+        m5.stats.reset()
+
     # Start the simulator. This gives control to the C++ world and
     # starts the simulator. The returned event tells the simulation
     # script why the simulator exited.
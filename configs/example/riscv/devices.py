@@ -41,8 +41,11 @@ m5.util.addToPath('../../')
 from common.Caches import *
 from common import ObjectList
 
-have_kvm = "ArmV8KvmCPU" in ObjectList.cpu_list.get_names()
-have_fastmodel = "FastModelCortexA76" in ObjectList.cpu_list.get_names()
+_cpu_names = set(ObjectList.cpu_list.get_names())
+have_atomic = "AtomicSimpleCPU" in _cpu_names
+have_kvm = "ArmV8KvmCPU" in _cpu_names
+have_fastmodel = "FastModelCortexA76" in _cpu_names
+del _cpu_names
 
 class L1I(L1_ICache):
     tag_latency = 1
@@ -98,7 +101,7 @@ class CpuClusterRiscV(SubSystem):
     def __init__(self, system,  num_cpus, cpu_clock, cpu_voltage,
                  cpu_type, l1i_type, l1d_type, l2_type):
         
-        super(CpuClusterRiscV, self).__init__()
+        super().__init__()
         self._cpu_type = cpu_type
         self._l1i_type = l1i_type
         self._l1d_type = l1d_type
@@ -110,14 +113,19 @@ class CpuClusterRiscV(SubSystem):
         self.clk_domain = SrcClockDomain(clock=cpu_clock,
                                          voltage_domain=self.voltage_domain)
 
-        self.cpus = [ self._cpu_type(cpu_id=system.numCpus() + idx,
-                                     clk_domain=self.clk_domain)
-                      for idx in range(num_cpus) ]
-
-        for cpu in self.cpus:
+        # Create and set up the CPUs in a single pass
+        cpu_type = self._cpu_type
+        clk_domain = self.clk_domain
+        base_cpu_id = system.numCpus()
+        socket_id = system.numCpuClusters()
+        cpus = []
+        for idx in range(num_cpus):
+            cpu = cpu_type(cpu_id=base_cpu_id + idx, clk_domain=clk_domain)
             cpu.createThreads()
             cpu.createInterruptController()
-            cpu.socket_id = system.numCpuClusters()
+            cpu.socket_id = socket_id
+            cpus.append(cpu)
+        self.cpus = cpus
         system.addCpuCluster(self, num_cpus)
         # print('Issue is here')
 
@@ -128,9 +136,13 @@ class CpuClusterRiscV(SubSystem):
         return self._cpu_type.memory_mode()
 
     def addL1(self):
+        l1i_type = self._l1i_type
+        l1d_type = self._l1d_type
+        if l1i_type is None and l1d_type is None:
+            return
         for cpu in self.cpus:
-            l1i = None if self._l1i_type is None else self._l1i_type()
-            l1d = None if self._l1d_type is None else self._l1d_type()
+            l1i = None if l1i_type is None else l1i_type()
+            l1d = None if l1d_type is None else l1d_type()
             cpu.addPrivateSplitL1Caches(l1i, l1d)
 
     def addL2(self, clk_domain):
@@ -138,11 +150,12 @@ class CpuClusterRiscV(SubSystem):
             return
         self.toL2Bus = L2XBar(width=64, clk_domain=clk_domain)
         self.l2 = self._l2_type()
+        cpu_side_ports = self.toL2Bus.cpu_side_ports
         for cpu in self.cpus:
-            cpu.connectCachedPorts(self.toL2Bus.cpu_side_ports)
+            cpu.connectCachedPorts(cpu_side_ports)
         self.toL2Bus.mem_side_ports = self.l2.cpu_side
 
-    def addPMUs(self, ints, events=[]):
+    def addPMUs(self, ints, events=None):
         """
         Instantiates 1 ArmPMU per PE. The method is accepting a list of
         interrupt numbers (ints) used by the PMU and a list of events to
@@ -155,59 +168,83 @@ class CpuClusterRiscV(SubSystem):
         :param events: Additional events to be measured by the PMUs
         :type events: List[Union[ProbeEvent, SoftwareIncrement]]
         """
+        if events is None:
+            events = ()
         assert len(ints) == len(self.cpus)
+        l2 = getattr(self, 'l2', None)
         for cpu, pint in zip(self.cpus, ints):
             int_cls = ArmPPI if pint < 32 else ArmSPI
+            itb = cpu.mmu.itb
+            dtb = cpu.mmu.dtb
+            icache = getattr(cpu, 'icache', None)
+            dcache = getattr(cpu, 'dcache', None)
             for isa in cpu.isa:
-                isa.pmu = ArmPMU(interrupt=int_cls(num=pint))
-                isa.pmu.addArchEvents(cpu=cpu,
-                                      itb=cpu.mmu.itb, dtb=cpu.mmu.dtb,
-                                      icache=getattr(cpu, 'icache', None),
-                                      dcache=getattr(cpu, 'dcache', None),
-                                      l2cache=getattr(self, 'l2', None))
+                pmu = ArmPMU(interrupt=int_cls(num=pint))
+                isa.pmu = pmu
+                pmu.addArchEvents(cpu=cpu, itb=itb, dtb=dtb,
+                                  icache=icache, dcache=dcache,
+                                  l2cache=l2)
                 for ev in events:
-                    isa.pmu.addEvent(ev)
+                    pmu.addEvent(ev)
 
     def connectMemSide(self, bus):
-        try:
-            self.l2.mem_side = bus.cpu_side_ports
-        except AttributeError:
-            for cpu in self.cpus:
-                cpu.connectCachedPorts(bus.cpu_side_ports)
+        l2 = getattr(self, 'l2', None)
+        if l2 is not None:
+            l2.mem_side = bus.cpu_side_ports
+            return
+        for cpu in self.cpus:
+            cpu.connectCachedPorts(bus.cpu_side_ports)
+
 
+# The generic AtomicSimpleCPU alias only exists in single-ISA builds
+if have_atomic:
+    _ATOMIC_CPU_CONFIG = (ObjectList.cpu_list.get("AtomicSimpleCPU"),
+                          None, None, None)
 
 class AtomicCluster(CpuClusterRiscV):
     def __init__(self, system, num_cpus, cpu_clock, cpu_voltage="1.0V"):
-        cpu_config = [ ObjectList.cpu_list.get("AtomicSimpleCPU"), None,
-                       None, None, None ]
-        super(AtomicCluster, self).__init__(system, num_cpus, cpu_clock,
-                                            cpu_voltage, *cpu_config)
+        if not have_atomic:
+            raise RuntimeError("AtomicSimpleCPU is not available in this gem5 "
+                               "build")
+        super().__init__(system, num_cpus, cpu_clock, cpu_voltage,
+                         *_ATOMIC_CPU_CONFIG)
     def addL1(self):
         pass
 
+if have_kvm:
+    _KVM_CPU_CONFIG = (ObjectList.cpu_list.get("ArmV8KvmCPU"),
+                       None, None, None)
+
 class KvmCluster(CpuClusterRiscV):
     def __init__(self, system, num_cpus, cpu_clock, cpu_voltage="1.0V"):
-        cpu_config = [ ObjectList.cpu_list.get("ArmV8KvmCPU"), None, None,
-            None, None ]
-        super(KvmCluster, self).__init__(system, num_cpus, cpu_clock,
-                                         cpu_voltage, *cpu_config)
+        if not have_kvm:
+            raise RuntimeError("ArmV8KvmCPU is not available in this gem5 "
+                               "build")
+        super().__init__(system, num_cpus, cpu_clock, cpu_voltage,
+                         *_KVM_CPU_CONFIG)
     def addL1(self):
         pass
 
+# Fast model CPU classes indexed by number of cores - 1
+if have_fastmodel:
+    _FASTMODEL_CPU_CLASSES = (FastModelCortexA76x1, FastModelCortexA76x2,
+                              FastModelCortexA76x3, FastModelCortexA76x4)
+
 class FastmodelCluster(SubSystem):
     def __init__(self, system,  num_cpus, cpu_clock, cpu_voltage="1.0V"):
-        super(FastmodelCluster, self).__init__()
+        super().__init__()
 
         # Setup GIC
         gic = system.realview.gic
-        gic.sc_gic.cpu_affinities = ','.join(
-            [ '0.0.%d.0' % i for i in range(num_cpus) ])
+        sc_gic = gic.sc_gic
+        sc_gic.cpu_affinities = ','.join(
+            [ f'0.0.{i}.0' for i in range(num_cpus) ])
 
         # Parse the base address of redistributor.
         redist_base = gic.get_redist_bases()[0]
-        redist_frame_size = 0x40000 if gic.sc_gic.has_gicv4_1 else 0x20000
-        gic.sc_gic.reg_base_per_redistributor = ','.join([
-            '0.0.%d.0=%#x' % (i, redist_base + redist_frame_size * i)
+        redist_frame_size = 0x40000 if sc_gic.has_gicv4_1 else 0x20000
+        sc_gic.reg_base_per_redistributor = ','.join([
+            f'0.0.{i}.0={redist_base + redist_frame_size * i:#x}'
             for i in range(num_cpus)
         ])
 
@@ -231,9 +268,7 @@ class FastmodelCluster(SubSystem):
 
         # Setup CPU
         assert num_cpus <= 4
-        CpuClasses = [FastModelCortexA76x1, FastModelCortexA76x2,
-                      FastModelCortexA76x3, FastModelCortexA76x4]
-        CpuClass = CpuClasses[num_cpus - 1]
+        CpuClass = _FASTMODEL_CPU_CLASSES[num_cpus - 1]
 
         cpu = CpuClass(GICDISABLE=False)
         for core in cpu.cores:
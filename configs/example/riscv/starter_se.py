@@ -131,12 +131,13 @@ def get_processes(cmd):
     """Interprets commands to run and returns a list of processes"""
 
     cwd = os.getcwd()
+    gid = os.getgid()
     multiprocesses = []
     for idx, c in enumerate(cmd):
         argv = shlex.split(c)
 
         process = Process(pid=100 + idx, cwd=cwd, cmd=argv, executable=argv[0])
-        process.gid = os.getgid()
+        process.gid = gid
 
         print("info: %d. command and arguments: %s" % (idx + 1, process.cmd))
         multiprocesses.append(process)
@@ -0,0 +1,132 @@
+#! /usr/bin/env python3
+
+# Copyright (c) 2026 The riscv_gem5 contributors
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+# Run a configuration sweep of the starter_se.py example script.
+#
+# The sweep file is a JSON list where every entry is the list of
+# arguments for one starter_se.py run. Each run gets its own output
+# directory (<outdir>/<index>) and log file, and up to --jobs runs are
+# executed in parallel on the host.
+#
+# gem5 can only instantiate a system once per process, so every
+# configuration needs a fresh simulator process.
+#
+# The script needs Python 3.8 or newer for os.posix_spawn().
+#
+# Example:
+#
+# util/starter-se-sweep.py -j 8 build/ARM/gem5.opt sweep.json
+#
+# with sweep.json containing:
+#
+# [["--cpu", "pk", "--l2_size", "1MB", "hello"],
+#  ["--cpu", "pk", "--l2_size", "2MB", "hello"]]
+
+import argparse
+import json
+import os
+import sys
+
+parser = argparse.ArgumentParser()
+
+parser.add_argument(
+    "-j",
+    "--jobs",
+    type=int,
+    default=os.cpu_count() or 1,
+    help="Number of simulations to run in parallel",
+)
+parser.add_argument(
+    "-d",
+    "--outdir",
+    default="m5out-sweep",
+    help="Base directory for the per-run output directories",
+)
+parser.add_argument(
+    "--script",
+    default="configs/example/arm/starter_se.py",
+    help="gem5 configuration script to run",
+)
+parser.add_argument("binary", help="gem5 binary")
+parser.add_argument("sweep_file", help="JSON file with the run arguments")
+
+args = parser.parse_args()
+
+if args.jobs < 1:
+    parser.error("--jobs must be at least 1")
+
+with open(args.sweep_file) as f:
+    sweep = json.load(f)
+
+running = {}
+failed = []
+
+
+def wait_for_run():
+    pid, status = os.waitpid(-1, 0)
+    idx = running.pop(pid)
+    if not os.WIFEXITED(status) or os.WEXITSTATUS(status) != 0:
+        failed.append(idx)
+
+
+for idx, run_args in enumerate(sweep):
+    if len(running) >= args.jobs:
+        wait_for_run()
+
+    outdir = os.path.join(args.outdir, str(idx))
+    os.makedirs(outdir, exist_ok=True)
+    log = os.path.join(outdir, "gem5.log")
+    log_flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+    argv = [args.binary, "-d", outdir, args.script] + run_args
+
+    print("info: %d. %s" % (idx, " ".join(argv)))
+    try:
+        pid = os.posix_spawn(
+            args.binary,
+            argv,
+            os.environ,
+            file_actions=[
+                (os.POSIX_SPAWN_OPEN, 1, log, log_flags, 0o644),
+                (os.POSIX_SPAWN_DUP2, 1, 2),
+            ],
+        )
+    except OSError as e:
+        # Don't start any more runs, but let the running ones finish.
+        print("Error: failed to start run %d: %s" % (idx, e))
+        failed.append(idx)
+        break
+    running[pid] = idx
+
+while running:
+    wait_for_run()
+
+if failed:
+    print("Error: runs %s failed" % ", ".join(str(i) for i in sorted(failed)))
+    sys.exit(1)
+
+print("sweep finished without errors")